@@ -1,6 +1,6 @@
 """Unit tests for git_proxy.py."""
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, Mock
 
 import pytest
 from click import UsageError
@@ -10,11 +10,15 @@ import emm.clients.git_proxy as under_test
 # TODO: Find a better way to handle the Path module when testing 3.7
 # We shouldn't have to mock the entire Path module when testing
 
-NAMESPACE = "emm.clients.git_proxy"
-
-
-def ns(local_path: str) -> str:
-    return f"{NAMESPACE}.{local_path}"
+MODULES_PATH = Path("/path/to/modules").absolute()
+REPO_PATH = Path("/path/to/repo").absolute()
+ABSOLUTE_PATH = Path("/a/absolute/path").absolute()
+SIMPLE_COMMANDS = [
+    ("fetch", (), ["fetch", "origin"]),
+    ("checkout", ("abc123",), ["checkout", "abc123"]),
+    ("rebase", ("abc123",), ["rebase", "--onto", "abc123"]),
+    ("merge", ("abc123",), ["merge", "abc123"]),
+]
 
 
 def make_fake_path() -> Path:
@@ -24,7 +28,6 @@ def make_fake_path() -> Path:
 @pytest.fixture()
 def mock_git():
     git_mock = MagicMock()
-    git_mock.assert_git_call = lambda args: git_mock.__getitem__.assert_any_call(args)
     return git_mock
 
 
@@ -34,39 +37,75 @@ def git_proxy(mock_git) -> under_test.GitProxy:
     return git_proxy
 
 
+@pytest.fixture(autouse=True)
+def record_git_calls(mock_git):
+    git_calls = set()
+
+    def record_git_call(args):
+        git_calls.add(tuple(args))
+        return DEFAULT
+
+    def assert_git_call(args):
+        assert (
+            tuple(args) in git_calls
+        ), f"git was not called with {args}, calls: {sorted(git_calls)}"
+
+    mock_git.__getitem__.side_effect = record_git_call
+    mock_git.assert_git_call = assert_git_call
+
+
+@pytest.fixture(autouse=True)
+def local_mock(monkeypatch):
+    local_mock = MagicMock()
+    monkeypatch.setattr(under_test, "local", local_mock)
+    return local_mock
+
+
+@pytest.fixture()
+def path_mock(monkeypatch):
+    path_mock = Mock()
+    monkeypatch.setattr(under_test, "Path", path_mock)
+    return path_mock
+
+
 class TestClone:
-    @patch(ns("local"))
     def test_clone_should_call_git_clone(self, local_mock, git_proxy, mock_git):
-        path = Path("/path/to/modules").absolute()
-        git_proxy.clone("module_name", "repo", path, branch=None)
+        git_proxy.clone("module_name", "repo", MODULES_PATH, branch=None)
 
         mock_git.assert_git_call(["clone", "repo", "module_name"])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(MODULES_PATH)
 
-    @patch(ns("local"))
     def test_clone_with_branch_should_call_git_clone_with_branch(
         self, local_mock, git_proxy, mock_git
     ):
-        path = Path("/path/to/modules").absolute()
-        git_proxy.clone("module_name", "repo", path, branch="main")
+        git_proxy.clone("module_name", "repo", MODULES_PATH, branch="main")
 
         mock_git.assert_git_call(["clone", "--branch", "main", "repo", "module_name"])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(MODULES_PATH)
 
 
-class TestFetch:
-    @patch(ns("local"))
-    @patch(ns("Path"))
-    def test_fetch_should_call_git_fetch(self, path_mock, local_mock, git_proxy, mock_git):
+@pytest.mark.parametrize("method,args,git_args", SIMPLE_COMMANDS)
+class TestSimpleGitCommands:
+    def test_no_directory_should_run_git_in_cwd(
+        self, path_mock, local_mock, git_proxy, mock_git, method, args, git_args
+    ):
         test_path = make_fake_path()
         path_mock.return_value = test_path
-        git_proxy.fetch()
+        getattr(git_proxy, method)(*args)
 
-        mock_git.assert_git_call(["fetch", "origin"])
+        mock_git.assert_git_call(git_args)
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
+    def test_directory_should_switch_directories(
+        self, local_mock, git_proxy, mock_git, method, args, git_args
+    ):
+        getattr(git_proxy, method)(*args, directory=REPO_PATH)
+
+        mock_git.assert_git_call(git_args)
+        local_mock.cwd.assert_called_with(REPO_PATH)
+
+
+class TestFetch:
     def test_fetch_should_call_git_fetch_with_base_local_branch_update(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -77,20 +116,8 @@ class TestFetch:
         mock_git.assert_git_call(["fetch", "origin", "master:master"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    def test_fetch_with_directory_should_call_git_fetch_from_dir(
-        self, local_mock, git_proxy, mock_git
-    ):
-        path = Path("/path/to/modules").absolute()
-        git_proxy.fetch(directory=path)
-
-        mock_git.assert_git_call(["fetch", "origin"])
-        local_mock.cwd.assert_called_with(path)
-
 
 class TestPull:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_pull_should_call_git_pull(self, path_mock, local_mock, git_proxy, mock_git):
         test_path = make_fake_path()
         path_mock.return_value = test_path
@@ -99,18 +126,14 @@ class TestPull:
         mock_git.assert_git_call(["pull"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
     def test_pull_with_directory_should_call_git_pull_from_directory(
         self, local_mock, git_proxy, mock_git
     ):
-        path = Path("/path/to/modules").absolute()
-        git_proxy.pull(directory=path)
+        git_proxy.pull(directory=MODULES_PATH)
 
         mock_git.assert_git_call(["pull"])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(MODULES_PATH)
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_rebase_option_should_call_git_pull_with_rebase(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -123,18 +146,6 @@ class TestPull:
 
 
 class TestCheckout:
-    @patch(ns("local"))
-    @patch(ns("Path"))
-    def test_checkout_should_call_git_checkout(self, path_mock, local_mock, git_proxy, mock_git):
-        test_path = make_fake_path()
-        path_mock.return_value = test_path
-        git_proxy.checkout("abc123", directory=None, branch_name=None)
-
-        mock_git.assert_git_call(["checkout", "abc123"])
-        local_mock.cwd.assert_called_with(test_path)
-
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_checkout_with_branch_should_call_git_checkout_with_branch(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -145,20 +156,8 @@ class TestCheckout:
         mock_git.assert_git_call(["checkout", "-b", "main", "abc123"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    def test_checkout_with_directory_should_call_git_checkout_from_directory(
-        self, local_mock, git_proxy, mock_git
-    ):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.checkout("abc123", directory=path, branch_name=None)
-
-        mock_git.assert_git_call(["checkout", "abc123"])
-        local_mock.cwd.assert_called_with(path)
-
 
 class TestBranch:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_branch_should_call_git_branch(self, path_mock, local_mock, git_proxy, mock_git):
         test_path = make_fake_path()
         path_mock.return_value = test_path
@@ -167,8 +166,6 @@ class TestBranch:
         mock_git.assert_git_call(["branch"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_branch_with_delete_should_call_git_branch_delete(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -179,20 +176,16 @@ class TestBranch:
         mock_git.assert_git_call(["branch", "-D", "abc123"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
     def test_branch_with_directory_should_call_git_branch_from_directory(
         self, local_mock, git_proxy, mock_git
     ):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.branch(directory=path)
+        git_proxy.branch(directory=REPO_PATH)
 
         mock_git.assert_git_call(["branch"])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestStatus:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_status_should_call_git_status(self, path_mock, local_mock, git_proxy, mock_git):
         test_path = make_fake_path()
         path_mock.return_value = test_path
@@ -201,8 +194,6 @@ class TestStatus:
         mock_git.assert_git_call(["status"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_status_with_short_should_call_git_status_short(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -213,20 +204,16 @@ class TestStatus:
         mock_git.assert_git_call(["status", "--short"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
     def test_status_with_directory_should_call_git_status_from_directory(
         self, local_mock, git_proxy, mock_git
     ):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.status(directory=path)
+        git_proxy.status(directory=REPO_PATH)
 
         mock_git.assert_git_call(["status"])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestLsFiles:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_ls_files_should_call_git_ls_files(self, path_mock, local_mock, git_proxy, mock_git):
         test_path = make_fake_path()
         path_mock.return_value = test_path
@@ -235,8 +222,6 @@ class TestLsFiles:
         mock_git.assert_git_call(["ls-files", "."])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_ls_files_with_options_should_call_git_ls_files_with_options(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -249,20 +234,16 @@ class TestLsFiles:
         )
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
     def test_ls_files_with_directory_should_call_git_ls_files_from_directory(
         self, local_mock, git_proxy, mock_git
     ):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.ls_files(["."], directory=path)
+        git_proxy.ls_files(["."], directory=REPO_PATH)
 
         mock_git.assert_git_call(["ls-files", "."])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestAdd:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_add_with_no_directory_should_call_git_add(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -273,18 +254,14 @@ class TestAdd:
         mock_git.assert_git_call(["add", "."])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
     def test_add_with_directory_should_switch_directories(self, local_mock, git_proxy, mock_git):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.add(["."], directory=path)
+        git_proxy.add(["."], directory=REPO_PATH)
 
         mock_git.assert_git_call(["add", "."])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestRestore:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_restore_with_no_directory_should_call_git_restore(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -295,8 +272,6 @@ class TestRestore:
         mock_git.assert_git_call(["restore", "."])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_restore_with_staged_should_call_git_with_staged_option(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -307,64 +282,16 @@ class TestRestore:
         mock_git.assert_git_call(["restore", "--staged", "."])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
     def test_restore_with_directory_should_switch_directories(
         self, local_mock, git_proxy, mock_git
     ):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.restore(["."], directory=path)
+        git_proxy.restore(["."], directory=REPO_PATH)
 
         mock_git.assert_git_call(["restore", "."])
-        local_mock.cwd.assert_called_with(path)
-
-
-class TestRebase:
-    @patch(ns("local"))
-    @patch(ns("Path"))
-    def test_rebase_with_no_directory_should_call_git_rebase(
-        self, path_mock, local_mock, git_proxy, mock_git
-    ):
-        test_path = make_fake_path()
-        path_mock.return_value = test_path
-        git_proxy.rebase(onto="abc123")
-
-        mock_git.assert_git_call(["rebase", "--onto", "abc123"])
-        local_mock.cwd.assert_called_with(test_path)
-
-    @patch(ns("local"))
-    def test_rebase_with_directory_should_switch_directories(self, local_mock, git_proxy, mock_git):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.rebase(onto="abc123", directory=path)
-
-        mock_git.assert_git_call(["rebase", "--onto", "abc123"])
-        local_mock.cwd.assert_called_with(path)
-
-
-class TestMerge:
-    @patch(ns("local"))
-    @patch(ns("Path"))
-    def test_merge_with_no_directory_should_call_git_rebase(
-        self, path_mock, local_mock, git_proxy, mock_git
-    ):
-        test_path = make_fake_path()
-        path_mock.return_value = test_path
-        git_proxy.merge("abc123")
-
-        mock_git.assert_git_call(["merge", "abc123"])
-        local_mock.cwd.assert_called_with(test_path)
-
-    @patch(ns("local"))
-    def test_merge_with_directory_should_switch_directories(self, local_mock, git_proxy, mock_git):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.merge("abc123", directory=path)
-
-        mock_git.assert_git_call(["merge", "abc123"])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestCurrentCommit:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_current_commit_with_no_directory_should_return_git_hash(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -377,23 +304,19 @@ class TestCurrentCommit:
         mock_git.assert_git_call(["rev-parse", "HEAD"])
         assert git_commit == "abc123"
 
-    @patch(ns("local"))
     def test_current_commit_with_directory_should_switch_directories(
         self, local_mock, git_proxy, mock_git
     ):
         mock_git.__getitem__.return_value.return_value = "abc123\n"
 
-        path = Path("/path/to/repo").absolute()
-        git_commit = git_proxy.current_commit(directory=path)
+        git_commit = git_proxy.current_commit(directory=REPO_PATH)
 
         mock_git.assert_git_call(["rev-parse", "HEAD"])
         assert git_commit == "abc123"
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestMergeBase:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_merge_base_with_no_directory_should_return_merge_base(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -406,23 +329,19 @@ class TestMergeBase:
         mock_git.assert_git_call(["merge-base", "commit_1", "HEAD"])
         assert git_commit == "abc123"
 
-    @patch(ns("local"))
     def test_merge_base_with_directory_should_switch_directories(
         self, local_mock, git_proxy, mock_git
     ):
         mock_git.__getitem__.return_value.return_value = "abc123\n"
 
-        path = Path("/path/to/repo").absolute()
-        git_commit = git_proxy.merge_base("commit_1", "HEAD", directory=path)
+        git_commit = git_proxy.merge_base("commit_1", "HEAD", directory=REPO_PATH)
 
         mock_git.assert_git_call(["merge-base", "commit_1", "HEAD"])
         assert git_commit == "abc123"
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestCommit:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_commit_with_no_directory_should_call_git_commit(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -433,8 +352,6 @@ class TestCommit:
         mock_git.assert_git_call(["commit", "--message", "commit message"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_commit_with_amend_should_call_git_commit_with_amend(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -445,8 +362,6 @@ class TestCommit:
         mock_git.assert_git_call(["commit", "--amend", "--reuse-message=HEAD"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_commit_with_add_should_call_git_commit_with_add(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -457,18 +372,14 @@ class TestCommit:
         mock_git.assert_git_call(["commit", "--amend", "--reuse-message=HEAD", "--all"])
         local_mock.cwd.assert_called_with(test_path)
 
-    @patch(ns("local"))
     def test_commit_with_directory_should_switch_directories(self, local_mock, git_proxy, mock_git):
-        path = Path("/path/to/repo").absolute()
-        git_proxy.commit("commit message", directory=path)
+        git_proxy.commit("commit message", directory=REPO_PATH)
 
         mock_git.assert_git_call(["commit", "--message", "commit message"])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestGetBaseName:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_get_base_name_should_return_default_basename(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -482,8 +393,6 @@ class TestGetBaseName:
 
 
 class TestCheckChanges:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_check_changes_should_return_changes(self, path_mock, local_mock, git_proxy, mock_git):
         test_path = make_fake_path()
         path_mock.return_value = test_path
@@ -494,8 +403,6 @@ class TestCheckChanges:
         mock_git.assert_git_call(["diff", "master..HEAD"])
         assert diff is True
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_current_branch_should_return_branch_name(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -508,8 +415,6 @@ class TestCheckChanges:
         mock_git.assert_git_call(["rev-parse", "--abbrev-ref", "HEAD"])
         assert diff == "branch"
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_branch_exist_on_remote_should_return_remote_branch(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
@@ -524,8 +429,6 @@ class TestCheckChanges:
 
 
 class TestPushBranchToRemote:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_push_should_call_git_push(self, path_mock, local_mock, git_proxy, mock_git):
         test_path = make_fake_path()
         path_mock.return_value = test_path
@@ -535,8 +438,6 @@ class TestPushBranchToRemote:
 
         mock_git.assert_git_call(["push", "-u", "origin", "HEAD"])
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_push_should_fail_on_protected_branch(self, path_mock, local_mock, git_proxy, mock_git):
         test_path = make_fake_path()
         path_mock.return_value = test_path
@@ -545,33 +446,28 @@ class TestPushBranchToRemote:
         with pytest.raises(UsageError):
             git_proxy.push_branch_to_remote()
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_push_with_directory_should_switch_directories(
         self, path_mock, local_mock, git_proxy, mock_git
     ):
         test_path = make_fake_path()
         path_mock.return_value = test_path
-        path = Path("/path/to/repo").absolute()
-        git_proxy.push_branch_to_remote(directory=path)
+        git_proxy.push_branch_to_remote(directory=REPO_PATH)
 
         mock_git.assert_git_call(["push", "-u", "origin", "HEAD"])
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
 
 
 class TestDetermineDirectory:
-    @patch(ns("local"))
-    def test_directory_of_none_should_return_cwd(self, local_mock, git_proxy):
-        local_mock.cwd = "fake"
-        assert git_proxy._determine_directory(None) == Path(local_mock.cwd)
-
-    @patch(ns("local"))
-    def test_relative_directory_should_return_full_path(self, local_mock, git_proxy):
-        directory = Path("a/relative/path")
+    @pytest.mark.parametrize(
+        "directory,expected",
+        [
+            (None, Path("fake")),
+            (Path("a/relative/path"), Path("fake") / "a/relative/path"),
+            (ABSOLUTE_PATH, ABSOLUTE_PATH),
+        ],
+    )
+    def test_directory_should_be_resolved_against_cwd(
+        self, local_mock, git_proxy, directory, expected
+    ):
         local_mock.cwd = "fake"
-        assert git_proxy._determine_directory(directory) == Path(local_mock.cwd / directory)
-
-    @patch(ns("local"))
-    def test_absolute_directory_should_return_directory(self, local_mock, git_proxy):
-        directory = Path("/a/absolute/path").absolute()
-        assert git_proxy._determine_directory(directory) == directory
+        assert git_proxy._determine_directory(directory) == expected
@@ -1,22 +1,18 @@
 """Unit tests for github_service.py."""
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
 import emm.clients.github_service as under_test
 
-NAMESPACE = "emm.clients.github_service"
-
-
-def ns(local_path: str) -> str:
-    return f"{NAMESPACE}.{local_path}"
+REPO_PATH = Path("/path/to/repo").absolute()
 
 
 @pytest.fixture()
 def mock_github_cli():
     github_mock = MagicMock()
-    github_mock.assert_gh_call = lambda args: github_mock.__getitem__.assert_any_call(args)
+    github_mock.assert_gh_call = github_mock.__getitem__.assert_any_call
     return github_mock
 
 
@@ -26,11 +22,23 @@ def github_service(mock_github_cli) -> under_test.GithubService:
     return github_service
 
 
+@pytest.fixture(autouse=True)
+def local_mock(monkeypatch):
+    local_mock = MagicMock()
+    monkeypatch.setattr(under_test, "local", local_mock)
+    return local_mock
+
+
+@pytest.fixture()
+def path_mock(monkeypatch):
+    path_mock = Mock()
+    monkeypatch.setattr(under_test, "Path", path_mock)
+    return path_mock
+
+
 class TestPullRequest:
-    @patch(ns("local"))
-    @patch(ns("Path"))
     def test_pull_request_with_correct_args_should_return_pr_url(
-        self, local_mock, path_mock, github_service, mock_github_cli
+        self, path_mock, github_service, mock_github_cli
     ):
         mock_github_cli.__getitem__.return_value.return_value = "github.com/pull/123"
         pr_link = github_service.pull_request(["--title", "Test title", "--body", "Test Body"])
@@ -40,27 +48,21 @@ class TestPullRequest:
         )
         assert pr_link == "github.com/pull/123"
 
-    @patch(ns("local"))
-    @patch(ns("Path"))
-    def test_pr_comment_should_call_gh_commit(
-        self, local_mock, path_mock, github_service, mock_github_cli
-    ):
+    def test_pr_comment_should_call_gh_commit(self, path_mock, github_service, mock_github_cli):
         github_service.pr_comment("github.com/pull/123", "module_repo: github/pull/234")
 
         mock_github_cli.assert_gh_call(
             ["pr", "comment", "github.com/pull/123", "--body", "module_repo: github/pull/234"]
         )
 
-    @patch(ns("local"))
     def test_pr_comment_with_directory_should_switch_directory(
         self, local_mock, github_service, mock_github_cli
     ):
-        path = Path("/path/to/repo").absolute()
         github_service.pr_comment(
-            "github.com/pull/234", "base_repo: github/pull/123", directory=path
+            "github.com/pull/234", "base_repo: github/pull/123", directory=REPO_PATH
         )
 
         mock_github_cli.assert_gh_call(
             ["pr", "comment", "github.com/pull/234", "--body", "base_repo: github/pull/123"]
         )
-        local_mock.cwd.assert_called_with(path)
+        local_mock.cwd.assert_called_with(REPO_PATH)
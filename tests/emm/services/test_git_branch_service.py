@@ -11,6 +11,8 @@ from emm.clients.git_proxy import GitProxy
 from emm.models.repository import Repository
 from emm.services.modules_service import ModulesService, SyncedModuleInformation, UpdateStrategy
 
+MODULE_PATHS = tuple(Path(f"/path/to/module_{i}") for i in range(3))
+
 
 @pytest.fixture()
 def modules_service():
@@ -50,9 +52,7 @@ class TestCreateBranch:
             f"module_{i}": SyncedModuleInformation(revision=f"revision_{i}", module=module)
             for i, module in enumerate(modules)
         }
-        module_list = [
-            build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(len(modules))
-        ]
+        module_list = [build_mock_repository(i, path) for i, path in enumerate(MODULE_PATHS)]
         modules_service.collect_repositories.return_value = module_list
         modules_service.sync_all_modules.return_value = synced_modules
 
@@ -73,7 +73,7 @@ class TestBranchList:
         modules_service: ModulesService,
         git_proxy: GitProxy,
     ):
-        module_list = [build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(3)]
+        module_list = [build_mock_repository(i, path) for i, path in enumerate(MODULE_PATHS)]
         modules_service.collect_repositories.return_value = module_list
 
         repos = git_branch_service.branch_list()
@@ -92,7 +92,7 @@ class TestSwitchBranch:
         modules_service: ModulesService,
         git_proxy: GitProxy,
     ):
-        module_list = [build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(3)]
+        module_list = [build_mock_repository(i, path) for i, path in enumerate(MODULE_PATHS)]
         modules_service.collect_repositories.return_value = module_list
 
         repos = git_branch_service.switch_branch("my-branch")
@@ -110,7 +110,7 @@ class TestDeleteBranch:
         modules_service: ModulesService,
         git_proxy: GitProxy,
     ):
-        module_list = [build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(3)]
+        module_list = [build_mock_repository(i, path) for i, path in enumerate(MODULE_PATHS)]
         modules_service.collect_repositories.return_value = module_list
 
         repos = git_branch_service.delete_branch("my-branch")
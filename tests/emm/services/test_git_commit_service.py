@@ -2,7 +2,7 @@
 
 import textwrap
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from unittest.mock import MagicMock
 
 import pytest
@@ -12,6 +12,11 @@ from emm.clients.git_proxy import GitProxy
 from emm.models.repository import Repository
 from emm.services.modules_service import ModulesService
 
+N_FILES = 5
+MOCK_FILES = [f"file {i}" for i in range(N_FILES)]
+MOCK_STATUS = "\n".join(f"M  {file}" for file in MOCK_FILES)
+REPO_PATH = Path("/path/to/repo")
+
 
 @pytest.fixture()
 def modules_service():
@@ -39,39 +44,44 @@ def build_mock_repository(index: int, directory: Optional[Path] = None):
     )
 
 
+@pytest.fixture()
+def repositories(request, modules_service):
+    repositories = [
+        build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(request.param)
+    ]
+    modules_service.collect_repositories.return_value = repositories
+    return repositories
+
+
+@pytest.mark.parametrize("repositories", [3], indirect=True)
 class TestStatus:
     def test_status_should_call_git_status_on_all_repos(
         self,
         git_commit_service: under_test.GitCommitService,
-        modules_service: ModulesService,
         git_service: GitProxy,
+        repositories: List[Repository],
     ):
-        module_list = [build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(3)]
-        modules_service.collect_repositories.return_value = module_list
-
         repos = git_commit_service.status()
 
-        assert len(repos) == len(module_list)
-        assert git_service.status.call_count == len(module_list)
+        assert len(repos) == len(repositories)
+        assert git_service.status.call_count == len(repositories)
         for repo in repos:
-            assert repo.module_name in [module.name for module in module_list]
+            assert repo.module_name in [module.name for module in repositories]
             assert repo.output == git_service.status.return_value
 
 
+@pytest.mark.parametrize("repositories", [3], indirect=True)
 class TestAdd:
     def test_add_should_return_results_for_all_modules(
         self,
         git_commit_service: under_test.GitCommitService,
-        modules_service: ModulesService,
         git_service: GitProxy,
+        repositories: List[Repository],
     ):
-        module_list = [build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(3)]
-        modules_service.collect_repositories.return_value = module_list
-
         results = git_commit_service.add(["."])
 
-        assert len(results) == len(module_list)
-        assert git_service.add.call_count == len(module_list)
+        assert len(results) == len(repositories)
+        assert git_service.add.call_count == len(repositories)
 
 
 class TestAddToRepo:
@@ -81,14 +91,13 @@ class TestAddToRepo:
         git_service: GitProxy,
     ):
         repo = build_mock_repository(0)
-        n_files = 5
-        git_service.ls_files.return_value = [f"file {i}" for i in range(n_files)]
-        git_service.status.return_value = "\n".join([f"M  file {i}" for i in range(n_files)])
+        git_service.ls_files.return_value = MOCK_FILES
+        git_service.status.return_value = MOCK_STATUS
 
         result = git_commit_service.add_to_repo(["."], repo)
 
         assert result.module_name == repo.name
-        assert len(result.output.splitlines()) == n_files
+        assert len(result.output.splitlines()) == N_FILES
 
     def test_no_added_files_should_be_reported_empty_string(
         self,
@@ -97,7 +106,7 @@ class TestAddToRepo:
     ):
         repo = build_mock_repository(0)
         git_service.ls_files.return_value = []
-        git_service.status.return_value = "\n".join([f"M  file {i}" for i in range(5)])
+        git_service.status.return_value = MOCK_STATUS
 
         result = git_commit_service.add_to_repo(["."], repo)
 
@@ -105,20 +114,18 @@ class TestAddToRepo:
         assert result.output == ""
 
 
+@pytest.mark.parametrize("repositories", [3], indirect=True)
 class TestRestore:
     def test_restore_should_return_results_for_all_modules(
         self,
         git_commit_service: under_test.GitCommitService,
-        modules_service: ModulesService,
         git_service: GitProxy,
+        repositories: List[Repository],
     ):
-        module_list = [build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(3)]
-        modules_service.collect_repositories.return_value = module_list
-
         results = git_commit_service.restore(["."], staged=False)
 
-        assert len(results) == len(module_list)
-        assert git_service.restore.call_count == len(module_list)
+        assert len(results) == len(repositories)
+        assert git_service.restore.call_count == len(repositories)
 
 
 class TestRestoreFromRepo:
@@ -128,14 +135,13 @@ class TestRestoreFromRepo:
         git_service: GitProxy,
     ):
         repo = build_mock_repository(0)
-        n_files = 5
-        git_service.ls_files.return_value = [f"file {i}" for i in range(n_files)]
-        git_service.status.return_value = "\n".join([f"M  file {i}" for i in range(n_files)])
+        git_service.ls_files.return_value = MOCK_FILES
+        git_service.status.return_value = MOCK_STATUS
 
         result = git_commit_service.restore_from_repo(["."], True, repo)
 
         assert result.module_name == repo.name
-        assert len(result.output.splitlines()) == n_files
+        assert len(result.output.splitlines()) == N_FILES
 
     def test_no_restored_files_should_be_reported_empty_string(
         self,
@@ -144,7 +150,7 @@ class TestRestoreFromRepo:
     ):
         repo = build_mock_repository(0)
         git_service.ls_files.return_value = []
-        git_service.status.return_value = "\n".join([f"M  file {i}" for i in range(5)])
+        git_service.status.return_value = MOCK_STATUS
 
         result = git_commit_service.restore_from_repo(["."], False, repo)
 
@@ -160,11 +166,11 @@ class TestFilesToTrack:
     ):
         directory = MagicMock(spec_set=Path)
         repo = build_mock_repository(0, directory)
-        git_service.ls_files.return_value = [f"file {i}" for i in range(5)]
+        git_service.ls_files.return_value = MOCK_FILES
 
         file_set = git_commit_service.files_to_track(["."], repo)
 
-        assert len(file_set) == 5
+        assert len(file_set) == N_FILES
         git_service.ls_files.assert_called_with(
             ["."], cached=True, others=True, ignore_file=".gitignore", directory=directory
         )
@@ -177,78 +183,64 @@ class TestFilesToTrack:
         directory = MagicMock(spec_set=Path)
         repo = build_mock_repository(0, directory)
         directory.__truediv__.return_value.exists.return_value = False
-        git_service.ls_files.return_value = [f"file {i}" for i in range(5)]
+        git_service.ls_files.return_value = MOCK_FILES
 
         file_set = git_commit_service.files_to_track(["."], repo)
 
-        assert len(file_set) == 5
+        assert len(file_set) == N_FILES
         git_service.ls_files.assert_called_with(
             ["."], cached=True, others=True, ignore_file=None, directory=directory
         )
 
 
+@pytest.mark.parametrize("repositories", [3], indirect=True)
 class TestCommit:
     def test_commit_with_message_should_call_git_commit_on_all_repos(
         self,
         git_commit_service: under_test.GitCommitService,
-        modules_service: ModulesService,
         git_service: GitProxy,
+        repositories: List[Repository],
     ):
-        n_modules = 3
-        module_list = [
-            build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(n_modules)
-        ]
-        modules_service.collect_repositories.return_value = module_list
         git_service.status.return_value = """M  file1.txt"""
 
         repos = git_commit_service.commit("my message", False, False)
 
-        assert len(repos) == n_modules
-        assert git_service.commit.call_count == n_modules
+        assert len(repos) == len(repositories)
+        assert git_service.commit.call_count == len(repositories)
         git_service.commit.assert_any_call(
-            "my message", amend=False, add=False, directory=module_list[0].directory
+            "my message", amend=False, add=False, directory=repositories[0].directory
         )
 
     def test_commit_with_append_should_call_git_commit_on_all_repos(
         self,
         git_commit_service: under_test.GitCommitService,
-        modules_service: ModulesService,
         git_service: GitProxy,
+        repositories: List[Repository],
     ):
-        n_modules = 3
-        module_list = [
-            build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(n_modules)
-        ]
-        modules_service.collect_repositories.return_value = module_list
         git_service.status.return_value = """M  file1.txt"""
 
         repos = git_commit_service.commit(None, amend=True, add=False)
 
-        assert len(repos) == n_modules
-        assert git_service.commit.call_count == n_modules
+        assert len(repos) == len(repositories)
+        assert git_service.commit.call_count == len(repositories)
         git_service.commit.assert_any_call(
-            None, amend=True, add=False, directory=module_list[0].directory
+            None, amend=True, add=False, directory=repositories[0].directory
         )
 
     def test_commit_with_add_should_call_git_commit_on_all_repos(
         self,
         git_commit_service: under_test.GitCommitService,
-        modules_service: ModulesService,
         git_service: GitProxy,
+        repositories: List[Repository],
     ):
-        n_modules = 3
-        module_list = [
-            build_mock_repository(i, Path(f"/path/to/module_{i}")) for i in range(n_modules)
-        ]
-        modules_service.collect_repositories.return_value = module_list
         git_service.status.return_value = """M  file1.txt"""
 
         repos = git_commit_service.commit("my message", amend=False, add=True)
 
-        assert len(repos) == n_modules
-        assert git_service.commit.call_count == n_modules
+        assert len(repos) == len(repositories)
+        assert git_service.commit.call_count == len(repositories)
         git_service.commit.assert_any_call(
-            "my message", amend=False, add=True, directory=module_list[0].directory
+            "my message", amend=False, add=True, directory=repositories[0].directory
         )
 
 
@@ -263,7 +255,7 @@ class TestGetStatusLines:
         M  file2.txt
          M file3.txt
         """
-        repo = build_mock_repository(0, directory=Path("/path/to/repo"))
+        repo = build_mock_repository(0, directory=REPO_PATH)
 
         status_lines = git_commit_service.get_status_lines(repo)
 
@@ -288,7 +280,7 @@ class TestGetTouchedFiles:
         ?? file4.txt
         """
         )
-        repo = build_mock_repository(0, directory=Path("/path/to/repo"))
+        repo = build_mock_repository(0, directory=REPO_PATH)
 
         touched_files = git_commit_service.get_touched_files(repo)
 
@@ -314,7 +306,7 @@ class TestHasCommitableChange:
         ?? file4.txt
         """
         )
-        repo = build_mock_repository(0, directory=Path("/path/to/repo"))
+        repo = build_mock_repository(0, directory=REPO_PATH)
 
         assert git_commit_service.has_commitable_change(add=False, repo=repo)
 
@@ -328,7 +320,7 @@ class TestHasCommitableChange:
  M file3.txt
 ?? file4.txt"""
 
-        repo = build_mock_repository(0, directory=Path("/path/to/repo"))
+        repo = build_mock_repository(0, directory=REPO_PATH)
 
         assert not git_commit_service.has_commitable_change(add=False, repo=repo)
 
@@ -342,7 +334,7 @@ class TestHasCommitableChange:
  M file3.txt
 ?? file4.txt"""
 
-        repo = build_mock_repository(0, directory=Path("/path/to/repo"))
+        repo = build_mock_repository(0, directory=REPO_PATH)
 
         assert git_commit_service.has_commitable_change(add=True, repo=repo)
 
@@ -353,6 +345,6 @@ class TestHasCommitableChange:
     ):
         git_service.status.return_value = """?? file4.txt"""
 
-        repo = build_mock_repository(0, directory=Path("/path/to/repo"))
+        repo = build_mock_repository(0, directory=REPO_PATH)
 
         assert not git_commit_service.has_commitable_change(add=True, repo=repo)
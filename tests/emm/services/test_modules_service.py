@@ -1,7 +1,9 @@
 """Unit tests for modules_service.py."""
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from typing import Mapping
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from shrub.v3.evg_project import EvgModule
@@ -13,29 +15,31 @@ from emm.models.repository import BASE_REPO
 from emm.options import EmmOptions
 from emm.services.file_service import FileService
 
+NEW_MODULE_PATH_EXISTS = (False, False, True)
+ALTERNATING_PATH_EXISTS = (True, False, True, False, True)
+
 
 @pytest.fixture()
 def emm_options():
-    emm_options = MagicMock(spec=EmmOptions)
-    emm_options.modules_directory = Path("target_directory")
+    emm_options = EmmOptions(modules_directory=Path("target_directory"))
     return emm_options
 
 
 @pytest.fixture()
 def evg_service():
-    evg_service = MagicMock(spec_set=EvgService)
+    evg_service = Mock(spec_set=EvgService)
     return evg_service
 
 
 @pytest.fixture()
 def git_service():
-    git_service = MagicMock(spec_set=GitProxy)
+    git_service = Mock(spec_set=GitProxy)
     return git_service
 
 
 @pytest.fixture()
 def file_service():
-    file_service = MagicMock(spec_set=FileService)
+    file_service = Mock(spec_set=FileService)
     return file_service
 
 
@@ -45,9 +49,13 @@ def modules_service(emm_options, evg_service, git_service, file_service):
     return modules_service
 
 
-def build_module_data(i: Optional[int] = None):
-    if i is None:
-        i = 0
+@pytest.fixture(autouse=True)
+def evg_service_defaults(evg_service):
+    evg_service.get_module_map.return_value = {}
+
+
+@lru_cache(maxsize=None)
+def build_module_data(i: int = 0):
     return EvgModule(
         name=f"mock module {i}",
         repo=f"git@github.com:org/mock-module-{i}.git",
@@ -56,6 +64,12 @@ def build_module_data(i: Optional[int] = None):
     )
 
 
+@lru_cache(maxsize=None)
+def build_module_map(n: int) -> Mapping[str, EvgModule]:
+    return MappingProxyType({f"module_name_{i}": build_module_data() for i in range(n)})
+
+
+@lru_cache(maxsize=None)
 def build_mock_repository(i: int) -> under_test.Repository:
     return under_test.Repository(
         name=f"module {i}", directory=Path(f"prefix/{i}/module {i}"), target_branch=f"branch_{i}"
@@ -73,52 +87,47 @@ class TestEnable:
 
         with pytest.raises(ValueError):
             modules_service.enable(module_name)
-            expected_path = Path(mock_module.get_repository_name()) / module_name
-            file_service.path_exists.assert_called_with(expected_path)
 
-    def test_non_existing_target_dir_should_be_created(
-        self, modules_service, evg_service, file_service
-    ):
-        module_name = "mock_module"
-        mock_module = build_module_data()
-        evg_service.get_module_map.return_value = {module_name: mock_module}
-        file_service.path_exists.side_effect = [False, False, True]
-
-        modules_service.enable(module_name)
-
-        expected_path = Path(mock_module.prefix)
-        file_service.mkdirs.assert_called_with(expected_path)
-
-    def test_symlink_should_be_created(
-        self, modules_service, evg_service, file_service, emm_options
-    ):
-        module_name = "mock_module"
-        mock_module = build_module_data()
-        evg_service.get_module_map.return_value = {module_name: mock_module}
-        file_service.path_exists.side_effect = [False, False, True]
-
-        modules_service.enable(module_name)
-
-        expected_target = Path(mock_module.prefix) / module_name
-        expected_source = emm_options.modules_directory / mock_module.get_repository_name()
-        file_service.create_symlink.assert_called_with(expected_target, expected_source.resolve())
+        expected_path = Path(mock_module.prefix) / module_name
+        file_service.path_exists.assert_called_with(expected_path)
 
-    def test_non_existing_module_should_be_cloned(
-        self, modules_service, evg_service, file_service, emm_options, git_service
+    @pytest.mark.parametrize(
+        "path_exists,target_dir_created",
+        [
+            (NEW_MODULE_PATH_EXISTS, True),
+            ((True, False, True), False),
+        ],
+    )
+    def test_enabling_a_module_should_clone_and_symlink_it(
+        self,
+        modules_service,
+        evg_service,
+        file_service,
+        emm_options,
+        git_service,
+        path_exists,
+        target_dir_created,
     ):
         module_name = "mock_module"
         mock_module = build_module_data()
         evg_service.get_module_map.return_value = {module_name: mock_module}
-        file_service.path_exists.return_value = False
+        file_service.path_exists.side_effect = path_exists
 
         modules_service.enable(module_name)
 
+        assert file_service.mkdirs.called == target_dir_created
+        if target_dir_created:
+            file_service.mkdirs.assert_called_with(Path(mock_module.prefix))
+        repository_name = mock_module.get_repository_name()
         git_service.clone.assert_called_with(
-            mock_module.get_repository_name(),
+            repository_name,
             mock_module.repo,
             emm_options.modules_directory,
             mock_module.branch,
         )
+        expected_target = Path(mock_module.prefix) / module_name
+        expected_source = emm_options.modules_directory / repository_name
+        file_service.create_symlink.assert_called_with(expected_target, expected_source.resolve())
 
 
 class TestDisable:
@@ -147,9 +156,7 @@ class TestDisable:
 
 
 class TestGetModuleData:
-    def test_missing_modules_should_raise_an_exception(self, modules_service, evg_service):
-        evg_service.get_module_map.return_value = {}
-
+    def test_missing_modules_should_raise_an_exception(self, modules_service):
         with pytest.raises(ValueError):
             modules_service.get_module_data("a missing modules")
 
@@ -167,10 +174,8 @@ class TestGetAllModules:
     def test_existing_modules_should_be_returned_when_enabled_requested(
         self, modules_service, file_service, evg_service
     ):
-        evg_service.get_module_map.return_value = {
-            f"module_name_{i}": build_module_data() for i in range(5)
-        }
-        file_service.path_exists.side_effect = [True, False, True, False, True]
+        evg_service.get_module_map.return_value = build_module_map(5)
+        file_service.path_exists.side_effect = ALTERNATING_PATH_EXISTS
 
         modules = modules_service.get_all_modules(enabled=True)
 
@@ -179,10 +184,8 @@ class TestGetAllModules:
     def test_all_modules_should_be_returned_when_enabled_not_requested(
         self, modules_service, file_service, evg_service
     ):
-        evg_service.get_module_map.return_value = {
-            f"module_name_{i}": build_module_data() for i in range(5)
-        }
-        file_service.path_exists.side_effect = [True, False, True, False, True]
+        evg_service.get_module_map.return_value = build_module_map(5)
+        file_service.path_exists.side_effect = ALTERNATING_PATH_EXISTS
 
         modules = modules_service.get_all_modules(enabled=False)
 
@@ -256,7 +259,6 @@ class TestCollectRepositories:
         evg_service: EvgService,
         file_service: FileService,
     ):
-        evg_service.get_module_map.return_value = {}
         file_service.path_exists.return_value = True
 
         repo_list = modules_service.collect_repositories()
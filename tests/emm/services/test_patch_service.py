@@ -1,5 +1,7 @@
 """Unit tests for patch_service.py."""
-from unittest.mock import MagicMock
+from functools import lru_cache
+from types import MappingProxyType
+from unittest.mock import MagicMock, Mock
 
 import pytest
 from shrub.v3.evg_project import EvgModule
@@ -10,20 +12,26 @@ from emm.clients.evg_service import EvgService
 from emm.options import EmmOptions
 from emm.services.file_service import FileService
 
+ALTERNATING_PATH_EXISTS = (True, False, True, False, True)
+PATCH_COMMANDS = [
+    ("create_patch", "add_module_to_patch", False),
+    ("create_cq_patch", "add_module_to_cq_patch", True),
+]
+
 
 @pytest.fixture()
 def file_service():
-    return MagicMock(spec_set=FileService)
+    return Mock(spec_set=FileService)
 
 
 @pytest.fixture()
 def evg_cli_service():
-    return MagicMock(spec_set=EvgCliService)
+    return Mock(spec_set=EvgCliService)
 
 
 @pytest.fixture()
 def evg_service():
-    return MagicMock(spec_set=EvgService)
+    return Mock(spec_set=EvgService)
 
 
 @pytest.fixture()
@@ -37,6 +45,7 @@ def patch_service(file_service, evg_cli_service, evg_service, emm_options):
     return patch_service
 
 
+@lru_cache(maxsize=None)
 def build_module_data(i):
     return EvgModule(
         name=f"mock_module_{i}",
@@ -46,110 +55,106 @@ def build_module_data(i):
     )
 
 
-class TestCreatePatch:
-    def test_a_patch_with_no_modules_should_be_created_and_finalized(
-        self, patch_service, evg_cli_service, evg_service
-    ):
-        evg_service.get_module_map.return_value = {}
+@lru_cache(maxsize=None)
+def build_module_map(n):
+    return MappingProxyType({f"module_{i}": build_module_data(i) for i in range(n)})
 
-        patch_info = patch_service.create_patch([])
 
-        assert patch_info == evg_cli_service.create_patch.return_value
-        evg_cli_service.add_module_to_patch.assert_not_called()
+@pytest.mark.parametrize("create_method,add_module_method,finalized", PATCH_COMMANDS)
+class TestCreatePatches:
+    def test_a_patch_with_no_modules_should_be_created(
+        self,
+        patch_service,
+        evg_cli_service,
+        evg_service,
+        create_method,
+        add_module_method,
+        finalized,
+    ):
+        evg_service.get_module_map.return_value = {}
 
-    def test_a_patch_with_no_enabled_modules_should_be_created_and_finalized(
-        self, patch_service, evg_cli_service, evg_service, file_service
+        patch_info = getattr(patch_service, create_method)([])
+
+        assert patch_info == getattr(evg_cli_service, create_method).return_value
+        getattr(evg_cli_service, add_module_method).assert_not_called()
+        assert evg_cli_service.finalize_cq_patch.called == finalized
+
+    def test_a_patch_with_no_enabled_modules_should_be_created(
+        self,
+        patch_service,
+        evg_cli_service,
+        evg_service,
+        file_service,
+        create_method,
+        add_module_method,
+        finalized,
     ):
-        evg_service.get_module_map.return_value = {
-            f"module_{i}": build_module_data(i) for i in range(10)
-        }
+        evg_service.get_module_map.return_value = build_module_map(10)
         file_service.path_exists.return_value = False
 
-        patch_info = patch_service.create_patch([])
-
-        assert patch_info == evg_cli_service.create_patch.return_value
-        evg_cli_service.add_module_to_patch.assert_not_called()
-
-    def test_a_patch_with_enabled_modules_should_be_created_and_finalized(
-        self, patch_service, evg_cli_service, evg_service, file_service
+        patch_info = getattr(patch_service, create_method)([])
+
+        assert patch_info == getattr(evg_cli_service, create_method).return_value
+        getattr(evg_cli_service, add_module_method).assert_not_called()
+        assert evg_cli_service.finalize_cq_patch.called == finalized
+
+    def test_a_patch_with_enabled_modules_should_be_created(
+        self,
+        patch_service,
+        evg_cli_service,
+        evg_service,
+        file_service,
+        create_method,
+        add_module_method,
+        finalized,
     ):
-        evg_service.get_module_map.return_value = {
-            f"module_{i}": build_module_data(i) for i in range(5)
-        }
-        file_service.path_exists.side_effect = [True, False, True, False, True]
+        evg_service.get_module_map.return_value = build_module_map(5)
+        file_service.path_exists.side_effect = ALTERNATING_PATH_EXISTS
 
-        patch_info = patch_service.create_patch([])
+        patch_info = getattr(patch_service, create_method)([])
 
-        assert patch_info == evg_cli_service.create_patch.return_value
-        assert 3 == evg_cli_service.add_module_to_patch.call_count
+        assert patch_info == getattr(evg_cli_service, create_method).return_value
+        assert 3 == getattr(evg_cli_service, add_module_method).call_count
+        assert evg_cli_service.finalize_cq_patch.called == finalized
 
     def test_patches_should_pass_along_extra_args(
-        self, patch_service, evg_cli_service, evg_service, file_service
+        self,
+        patch_service,
+        evg_cli_service,
+        evg_service,
+        file_service,
+        create_method,
+        add_module_method,
+        finalized,
     ):
-        evg_service.get_module_map.return_value = {
-            f"module_{i}": build_module_data(i) for i in range(5)
-        }
-        file_service.path_exists.side_effect = [True, False, True, False, True]
+        evg_service.get_module_map.return_value = build_module_map(5)
+        file_service.path_exists.side_effect = ALTERNATING_PATH_EXISTS
         extra_args = ["-u", "-d", "hello world"]
 
-        patch_info = patch_service.create_patch(extra_args)
+        patch_info = getattr(patch_service, create_method)(extra_args)
 
-        assert patch_info == evg_cli_service.create_patch.return_value
-        evg_cli_service.create_patch.assert_called_with(extra_args)
-        assert 3 == evg_cli_service.add_module_to_patch.call_count
+        assert patch_info == getattr(evg_cli_service, create_method).return_value
+        getattr(evg_cli_service, create_method).assert_called_with(extra_args)
+        assert 3 == getattr(evg_cli_service, add_module_method).call_count
+        assert evg_cli_service.finalize_cq_patch.called == finalized
 
 
 class TestCreateCqPatch:
-    def test_a_patch_with_no_modules_should_be_created_and_finalized(
-        self, patch_service, evg_cli_service, evg_service
-    ):
-        evg_service.get_module_map.return_value = {}
-
-        patch_info = patch_service.create_cq_patch([])
-
-        assert patch_info == evg_cli_service.create_cq_patch.return_value
-        evg_cli_service.finalize_cq_patch.assert_called_with(patch_info.patch_id)
-        evg_cli_service.add_module_to_cq_patch.assert_not_called()
-
-    def test_a_patch_with_no_enabled_modules_should_be_created_and_finalized(
-        self, patch_service, evg_cli_service, evg_service, file_service
-    ):
-        evg_service.get_module_map.return_value = {
-            f"module_{i}": build_module_data(i) for i in range(10)
-        }
-        file_service.path_exists.return_value = False
-
-        patch_info = patch_service.create_cq_patch([])
-
-        assert patch_info == evg_cli_service.create_cq_patch.return_value
-        evg_cli_service.finalize_cq_patch.assert_called_with(patch_info.patch_id)
-        evg_cli_service.add_module_to_cq_patch.assert_not_called()
-
-    def test_a_patch_with_enabled_modules_should_be_created_and_finalized(
-        self, patch_service, evg_cli_service, evg_service, file_service
-    ):
-        evg_service.get_module_map.return_value = {
-            f"module_{i}": build_module_data(i) for i in range(5)
-        }
-        file_service.path_exists.side_effect = [True, False, True, False, True]
-
-        patch_info = patch_service.create_cq_patch([])
-
-        assert patch_info == evg_cli_service.create_cq_patch.return_value
-        evg_cli_service.finalize_cq_patch.assert_called_with(patch_info.patch_id)
-        assert 3 == evg_cli_service.add_module_to_cq_patch.call_count
-
-    def test_a_patch_should_pass_extra_args_to_commands(
-        self, patch_service, evg_cli_service, evg_service, file_service
+    @pytest.mark.parametrize(
+        "n_modules,path_exists",
+        [
+            (0, False),
+            (5, False),
+            (5, True),
+        ],
+    )
+    def test_a_cq_patch_should_be_finalized(
+        self, patch_service, evg_cli_service, evg_service, file_service, n_modules, path_exists
     ):
-        evg_service.get_module_map.return_value = {
-            f"module_{i}": build_module_data(i) for i in range(5)
-        }
-        file_service.path_exists.side_effect = [True, False, True, False, True]
+        evg_service.get_module_map.return_value = build_module_map(n_modules)
+        file_service.path_exists.return_value = path_exists
 
         patch_info = patch_service.create_cq_patch(["--large"])
 
-        assert patch_info == evg_cli_service.create_cq_patch.return_value
-        evg_cli_service.finalize_cq_patch.assert_called_with(patch_info.patch_id)
-        assert 3 == evg_cli_service.add_module_to_cq_patch.call_count
         evg_cli_service.create_cq_patch.assert_called_with(["--large"])
+        evg_cli_service.finalize_cq_patch.assert_called_once_with(patch_info.patch_id)
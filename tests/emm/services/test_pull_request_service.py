@@ -1,5 +1,7 @@
 """Unit tests for pull_request_service.py."""
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Tuple
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,6 +10,7 @@ import emm.services.pull_request_service as under_test
 from emm.clients.evg_service import EvgService
 from emm.clients.git_proxy import GitProxy
 from emm.clients.github_service import GithubService
+from emm.options import EmmOptions
 from emm.services.modules_service import ModulesService
 
 
@@ -37,7 +40,7 @@ def evg_service():
 
 @pytest.fixture()
 def emm_options():
-    emm_options = MagicMock(evg_project="my project")
+    emm_options = EmmOptions(evg_project="my project")
     return emm_options
 
 
@@ -49,62 +52,99 @@ def pull_request_service(git_service, github_service, modules_service, evg_servi
     return pull_request_service
 
 
+class CallCounter:
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:
+        self.call_count += 1
+
+
+@lru_cache(maxsize=None)
 def build_mock_repository(i: int) -> under_test.Repository:
     return under_test.Repository(
         name=f"module {i}", directory=Path(f"prefix/{i}/module {i}"), target_branch=f"branch_{i}"
     )
 
 
+@lru_cache(maxsize=None)
+def build_mock_repositories(n: int) -> Tuple[under_test.Repository, ...]:
+    return tuple(build_mock_repository(i) for i in range(n))
+
+
 def build_mock_pull_request(i: int) -> under_test.PullRequest:
     return under_test.PullRequest(name=f"PR Name {i}", link=f"http://link.to.pr/{i}")
 
 
+@pytest.mark.orchestration
 class TestCreatePullRequest:
+    @pytest.mark.parametrize(
+        "n_modules,n_changed,n_comments",
+        [
+            (1, 1, 0),
+            (3, 2, 2),
+            (5, 3, 3),
+        ],
+    )
     def test_pull_request_should_be_orchestrated(
         self,
+        n_modules,
+        n_changed,
+        n_comments,
         pull_request_service: under_test.PullRequestService,
         modules_service: ModulesService,
         git_service: GitProxy,
         github_service: GithubService,
     ):
-        n_modules = 5
-        modules_service.collect_repositories.return_value = [
-            build_mock_repository(i) for i in range(n_modules)
-        ]
-        git_service.check_changes.side_effect = [True, False, True, False, True, False]
+        pull_request_counter = CallCounter()
+        github_service.pull_request = pull_request_counter
+        comment_counter = CallCounter()
+        github_service.pr_comment = comment_counter
+        modules_service.collect_repositories.return_value = build_mock_repositories(n_modules)
+        git_service.check_changes.side_effect = (i % 2 == 0 for i in range(n_modules))
 
         pr_links = pull_request_service.create_pull_request(None, None)
 
-        assert len(pr_links) == 3
-        assert github_service.pull_request.call_count == 3
-        assert github_service.pr_comment.call_count == 3
+        assert len(pr_links) == n_changed
+        assert pull_request_counter.call_count == n_changed
+        assert comment_counter.call_count == n_comments
 
 
 class TestPushChangesToOrigin:
+    @pytest.mark.parametrize("n_repos", [1, 3, 5])
     def test_all_repositories_should_have_their_changes_pushed(
-        self, pull_request_service: under_test.PullRequestService, git_service: GitProxy
+        self,
+        n_repos,
+        pull_request_service: under_test.PullRequestService,
+        git_service: GitProxy,
     ):
-        n_repos = 4
-        changed_repos = [build_mock_repository(i) for i in range(n_repos)]
+        push_counter = CallCounter()
+        git_service.push_branch_to_remote = push_counter
+        changed_repos = build_mock_repositories(n_repos)
 
         pull_request_service.push_changes_to_origin(changed_repos)
 
-        assert git_service.push_branch_to_remote.call_count == n_repos
+        assert push_counter.call_count == n_repos
 
 
 class TestCreatePrs:
+    @pytest.mark.parametrize("n_repos", [1, 3, 5])
     def test_prs_should_be_created_for_all_repos(
-        self, pull_request_service: under_test.PullRequestService, github_service: GithubService
+        self,
+        n_repos,
+        pull_request_service: under_test.PullRequestService,
+        github_service: GithubService,
     ):
-        n_repos = 3
-        changed_repos = [build_mock_repository(i) for i in range(n_repos)]
+        pull_request_counter = CallCounter()
+        github_service.pull_request = pull_request_counter
+        changed_repos = build_mock_repositories(n_repos)
 
         pr_links = pull_request_service.create_prs(changed_repos, ["arguments", "to", "gh"])
 
         assert len(pr_links) == n_repos
         for repo in changed_repos:
             assert any(link.name == repo.name for link in pr_links.values())
-        assert github_service.pull_request.call_count == n_repos
+        assert pull_request_counter.call_count == n_repos
 
 
 class TestAnnotatePrs:
@@ -117,16 +157,21 @@ class TestAnnotatePrs:
 
         github_service.pr_comment.assert_not_called()
 
+    @pytest.mark.parametrize("n_repos", [2, 3, 5])
     def test_all_given_repos_should_be_annotated_if_more_than_one_pr(
-        self, pull_request_service: under_test.PullRequestService, github_service: GithubService
+        self,
+        n_repos,
+        pull_request_service: under_test.PullRequestService,
+        github_service: GithubService,
     ):
-        n_repos = 5
-        changed_repos = [build_mock_repository(i) for i in range(n_repos)]
+        comment_counter = CallCounter()
+        github_service.pr_comment = comment_counter
+        changed_repos = build_mock_repositories(n_repos)
         pr_links = {repo.name: build_mock_pull_request(i) for i, repo in enumerate(changed_repos)}
 
         pull_request_service.annotate_prs(changed_repos, pr_links)
 
-        assert github_service.pr_comment.call_count == n_repos
+        assert comment_counter.call_count == n_repos
 
 
 class TestCreateComment:
@@ -151,9 +196,14 @@ class TestCreatePrArguments:
     @pytest.mark.parametrize(
         "title,body,arguments",
         [
-            (None, None, ["--fill"]),
-            ("my title", None, ["--title", "my title", "--body", "''"]),
-            ("my title", "my body", ["--title", "my title", "--body", "my body"]),
+            pytest.param(None, None, ["--fill"], id="fill"),
+            pytest.param("my title", None, ["--title", "my title", "--body", "''"], id="title"),
+            pytest.param(
+                "my title",
+                "my body",
+                ["--title", "my title", "--body", "my body"],
+                id="title-body",
+            ),
         ],
     )
     def test_arguments_should_work_correctly(
@@ -1,6 +1,6 @@
 """Unit tests for validation_service.py."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from click import UsageError
@@ -8,11 +8,11 @@ from click import UsageError
 import emm.services.validation_service as under_test
 from emm.services.file_service import FileService
 
-NAMESPACE = "emm.services.validation_service"
-
-
-def ns(local_path: str) -> str:
-    return f"{NAMESPACE}.{local_path}"
+VALIDATE_COMMANDS = [
+    ("git", "validate_git_command"),
+    ("gh", "validate_gh_command"),
+    ("evergreen", "validate_evergreen_command"),
+]
 
 
 @pytest.fixture()
@@ -27,71 +27,36 @@ def validation_service(file_service):
     return validation_service
 
 
-class TestValidateGitCommand:
-    def test_validate_should_raise_exception_if_command_is_missing(
-        self, validation_service, file_service
-    ):
-        file_service.which.return_value = None
-
-        with pytest.raises(UsageError):
-            validation_service.validate_git_command()
-
-        file_service.which.assert_called_with("git")
-
-    def test_validate_should_not_raise_exception_if_command_is_found(
-        self, validation_service, file_service
-    ):
-        file_service.which.return_value = "/usr/bin/git"
-
-        validation_service.validate_git_command()
-
-        file_service.which.assert_called_with("git")
-
-
-class TestValidateGhCommand:
-    def test_validate_should_raise_exception_if_command_is_missing(
-        self, validation_service, file_service
-    ):
-        file_service.which.return_value = None
-
-        with pytest.raises(UsageError):
-            validation_service.validate_gh_command()
-
-        file_service.which.assert_called_with("gh")
-
-    def test_validate_should_not_raise_exception_if_command_is_found(
-        self, validation_service, file_service
-    ):
-        file_service.which.return_value = "/usr/bin/gh"
-
-        validation_service.validate_gh_command()
-
-        file_service.which.assert_called_with("gh")
+@pytest.fixture()
+def check_gh_auth_mock(monkeypatch):
+    check_gh_auth_mock = MagicMock()
+    monkeypatch.setattr(under_test, "_check_github_auth_status", check_gh_auth_mock)
+    return check_gh_auth_mock
 
 
-class TestValidateEvergreenCommand:
+@pytest.mark.parametrize("command,method", VALIDATE_COMMANDS)
+class TestValidateCommands:
     def test_validate_should_raise_exception_if_command_is_missing(
-        self, validation_service, file_service
+        self, validation_service, file_service, command, method
     ):
         file_service.which.return_value = None
 
         with pytest.raises(UsageError):
-            validation_service.validate_evergreen_command()
+            getattr(validation_service, method)()
 
-        file_service.which.assert_called_with("evergreen")
+        file_service.which.assert_called_with(command)
 
     def test_validate_should_not_raise_exception_if_command_is_found(
-        self, validation_service, file_service
+        self, validation_service, file_service, command, method
     ):
-        file_service.which.return_value = "/usr/bin/evergreen"
+        file_service.which.return_value = f"/usr/bin/{command}"
 
-        validation_service.validate_evergreen_command()
+        getattr(validation_service, method)()
 
-        file_service.which.assert_called_with("evergreen")
+        file_service.which.assert_called_with(command)
 
 
 class TestValidateGithubAuthentication:
-    @patch(ns("_check_github_auth_status"))
     def test_validate_should_raise_exception_if_gh_is_not_authed(
         self, check_gh_auth_mock, validation_service
     ):
@@ -101,7 +66,6 @@ class TestValidateGithubAuthentication:
             validation_service.validate_github_authentication()
             print()
 
-    @patch(ns("_check_github_auth_status"))
     def test_validate_should_not_raise_exception_if_gh_is_authed(
         self, check_gh_auth_mock, validation_service
     ):
@@ -111,7 +75,6 @@ class TestValidateGithubAuthentication:
 
 
 class TestValidateGithub:
-    @patch(ns("_check_github_auth_status"))
     def test_validate_should_raise_exception_if_gh_is_not_authed(
         self, check_gh_auth_mock, validation_service, file_service
     ):
@@ -121,7 +84,6 @@ class TestValidateGithub:
         with pytest.raises(UsageError):
             validation_service.validate_github()
 
-    @patch(ns("_check_github_auth_status"))
     def test_validate_should_not_raise_exception_if_gh_command_is_not_found(
         self, check_gh_auth_mock, validation_service, file_service
     ):
@@ -133,7 +95,6 @@ class TestValidateGithub:
 
         file_service.which.assert_called_with("gh")
 
-    @patch(ns("_check_github_auth_status"))
     def test_validate_should_not_raise_exception_if_gh_is_authed_and_gh_exists(
         self, check_gh_auth_mock, validation_service, file_service
     ):